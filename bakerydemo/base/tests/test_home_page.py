@@ -32,13 +32,14 @@ class HomePageRenderTest(WagtailPageTestCase):
         cls.root.add_child(instance=cls.home)
         cls.home.save_revision().publish()
 
+        cls.user = User.objects.create_superuser(
+            username="testadmin", email="test@example.com", password="password"
+        )
+
     def setUp(self):
         super().setUp()
 
-        self.user = User.objects.create_superuser(
-            username="testadmin", email="test@example.com", password="password"
-        )
-        self.client.login(username="testadmin", password="password")
+        self.client.force_login(self.user)
 
     def test_homepage_renders(self):
         response = self.client.get(self.home.url)